@@ -1,6 +1,13 @@
 # pip install matplotlib sympy PyQt6
 import sys  # Importa el módulo sys para interactuar con el sistema(Terminal)
 import math  # Módulo para operaciones matemáticas básicas
+import os  # Rutas de archivos (archivo de sesión)
+import time  # Medición del tiempo de cada resolución
+import json  # Serialización del historial de iteraciones
+import hashlib  # Hash de la expresión para indexar resultados guardados
+import sqlite3  # Almacén persistente de sesiones
+import re  # Separación en tokens de las expresiones
+import multiprocessing  # Proceso aparte con tiempo límite para los pasos simbólicos
 
 # Importación de componentes de PyQt6 para construir la interfaz gráfica
 from PyQt6.QtWidgets import (
@@ -40,14 +47,732 @@ from sympy import (
     log,                       # logaritmo natural
     sqrt,                      # raíz cuadrada
     Abs,                       # valor absoluto
+    Matrix,                    # matrices simbólicas (sistemas de ecuaciones y jacobiano)
+    Symbol, Integer, Float,    # construcción directa de variables y números (intérprete seguro)
+    preorder_traversal,        # recorrido de expresiones para medir su tamaño
     E,                         # constante e
     pi,                        # constante π                       # infinito simbólico
 )
-# Se utiliza el parser avanzado de Sympy para interpretar cadenas y convertirlas en expresiones simbólicas
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application, convert_xor
 # Importación de Matplotlib para integrar gráficos en la interfaz (usando el backend para Qt)
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+# NumPy para resolver los pasos lineales de los sistemas de ecuaciones
+import numpy as np
+# Aritmética de intervalos de mpmath (dependencia de Sympy) para verificar raíces
+import mpmath
+from mpmath import iv
+from collections import deque
+
+
+# Intérprete seguro de expresiones
+# Convierte el texto del usuario en objetos de Sympy sin usar eval: solo se aceptan los
+# caracteres, funciones y constantes de las listas blancas, con límites de tamaño.
+
+LONGITUD_MAXIMA = 500          # Caracteres permitidos en una expresión
+NODOS_MAXIMOS = 400            # Números, variables, funciones y operadores en una expresión
+PROFUNDIDAD_MAXIMA = 40        # Anidamiento máximo (paréntesis, signos y potencias)
+DIGITOS_MAXIMOS = 2000         # Tamaño máximo de una potencia numérica (por ejemplo 10^10^10)
+NODOS_DERIVADA_MAXIMOS = 5000  # Tamaño máximo de la derivada o del jacobiano
+TIEMPO_LIMITE = 10             # Segundos para los pasos simbólicos (derivada/jacobiano)
+
+# Funciones que el usuario puede escribir
+FUNCIONES_PERMITIDAS = {
+    'sin': sin,
+    'cos': cos,
+    'tan': tan,
+    'asin': asin,
+    'acos': acos,
+    'atan': atan,
+    'sinh': sinh,
+    'cosh': cosh,
+    'tanh': tanh,
+    'exp': exp,
+    'ln': log,
+    'log': log,
+    'sqrt': sqrt,
+    'Abs': Abs,
+    'abs': Abs,
+}
+
+# Constantes que el usuario puede escribir
+CONSTANTES_PERMITIDAS = {
+    'e': E,
+    'E': E,
+    'pi': pi,
+}
+
+# Tokens: números (con exponente opcional), nombres, operadores y paréntesis
+PATRON_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z]+)|(\*\*|[-+*/^(),√]))")
+
+
+def separar_tokens(texto):
+    """
+    Divide el texto en tokens (tipo, valor). Como con split_symbols, los nombres pegados se
+    separan en funciones y constantes conocidas y variables de una letra ("2xsinx" = 2*x*sin(x),
+    "xy" = x*y).
+    """
+    if len(texto) > LONGITUD_MAXIMA:
+        raise ValueError(f"La expresión supera los {LONGITUD_MAXIMA} caracteres.")
+    nombres = sorted(list(FUNCIONES_PERMITIDAS) + list(CONSTANTES_PERMITIDAS), key=len, reverse=True)
+    tokens = []
+    pos = 0
+    texto = texto.rstrip()
+    while pos < len(texto):
+        m = PATRON_TOKEN.match(texto, pos)
+        if m is None:
+            raise ValueError(f"Carácter no permitido: '{texto[pos:].strip()[0]}'")
+        numero, nombre, operador = m.groups()
+        if numero is not None:
+            tokens.append(('numero', numero))
+        elif operador is not None:
+            tokens.append(('op', '**' if operador == '^' else operador))
+        else:
+            i = 0
+            while i < len(nombre):
+                conocido = next((n for n in nombres if nombre.startswith(n, i)), None)
+                if conocido is None:
+                    tokens.append(('variable', nombre[i]))
+                    i += 1
+                else:
+                    tipo = 'funcion' if conocido in FUNCIONES_PERMITIDAS else 'constante'
+                    tokens.append((tipo, conocido))
+                    i += len(conocido)
+        pos = m.end()
+    if len(tokens) > NODOS_MAXIMOS:
+        raise ValueError(f"La expresión tiene más de {NODOS_MAXIMOS} elementos.")
+    return tokens
+
+
+def digitos(numero):
+    """
+    Devuelve |log10(|numero|)|, es decir, cuántos dígitos aporta el número a una potencia.
+    Acepta cualquier expresión numérica (sqrt(2), 2*pi), no solo números de SymPy.
+    """
+    if numero.is_Rational:
+        # math.log10 admite enteros de cualquier tamaño sin convertirlos a float
+        return abs(math.log10(abs(numero.p)) - math.log10(numero.q))
+    return abs(float(log(abs(numero.evalf()), 10)))
+
+
+class InterpreteExpresion:
+    """
+    Analizador descendente recursivo que construye la expresión de Sympy directamente.
+    Gramática (de menor a mayor precedencia):
+        suma     := producto (('+' | '-') producto)*
+        producto := signo (('*' | '/') signo | signo implícito)*
+        signo    := ('+' | '-') signo | potencia
+        potencia := atomo ('^' signo)?
+        atomo    := número | variable | constante | '(' suma ')' | función argumento | '√' atomo
+    """
+
+    def __init__(self, texto):
+        self.tokens = separar_tokens(texto)
+        self.pos = 0
+        self.profundidad = 0
+
+    def interpretar(self):
+        if not self.tokens:
+            raise ValueError("La expresión está vacía.")
+        resultado = self.suma()
+        if self.pos < len(self.tokens):
+            raise ValueError(f"Símbolo inesperado: '{self.tokens[self.pos][1]}'")
+        return resultado
+
+    def actual(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def consumir(self, valor=None):
+        tipo, texto = self.actual()
+        if tipo is None or (valor is not None and texto != valor):
+            raise ValueError(f"Se esperaba '{valor}'" if valor else "La expresión está incompleta.")
+        self.pos += 1
+        return tipo, texto
+
+    def entrar(self):
+        # Controla el anidamiento para evitar expresiones excesivamente profundas
+        self.profundidad += 1
+        if self.profundidad > PROFUNDIDAD_MAXIMA:
+            raise ValueError(f"La expresión supera {PROFUNDIDAD_MAXIMA} niveles de anidamiento.")
+
+    def suma(self):
+        resultado = self.producto()
+        while self.actual() in (('op', '+'), ('op', '-')):
+            _, op = self.consumir()
+            termino = self.producto()
+            resultado = resultado + termino if op == '+' else resultado - termino
+        return resultado
+
+    def producto(self):
+        resultado = self.signo()
+        while True:
+            tipo, texto = self.actual()
+            if (tipo, texto) in (('op', '*'), ('op', '/')):
+                self.consumir()
+                factor = self.signo()
+                resultado = resultado * factor if texto == '*' else resultado / factor
+            elif tipo in ('numero', 'variable', 'constante', 'funcion') or texto in ('(', '√'):
+                # Multiplicación implícita: 2x, x(x+1), (x+1)(x-1), 2 sin x
+                resultado = resultado * self.potencia()
+            else:
+                return resultado
+
+    def signo(self):
+        if self.actual() in (('op', '+'), ('op', '-')):
+            _, op = self.consumir()
+            self.entrar()
+            operando = self.signo()
+            self.profundidad -= 1
+            return -operando if op == '-' else operando
+        return self.potencia()
+
+    def potencia(self):
+        base = self.atomo()
+        if self.actual() == ('op', '**'):
+            self.consumir()
+            self.entrar()
+            exponente = self.signo()
+            self.profundidad -= 1
+            # Evita potencias numéricas gigantes que congelarían el cálculo, con exponente de
+            # cualquier signo y base mayor o menor que 1 (10^10^10, 10^-10^10, (1/10)^(10^10)),
+            # también cuando la base es una constante simbólica (sqrt(2)^(10^100), (2pi)^(10^9))
+            if base.is_number and exponente.is_number and not base.is_zero and abs(base) != 1:
+                magnitud = float(min(abs(exponente.evalf()), 10 ** 18))
+                if magnitud * digitos(base) > DIGITOS_MAXIMOS:
+                    raise ValueError("La potencia numérica es demasiado grande.")
+            return base ** exponente
+        return base
+
+    def atomo(self):
+        tipo, texto = self.consumir()
+        if tipo == 'numero':
+            return Integer(texto) if texto.isdigit() else Float(texto)
+        if tipo == 'variable':
+            return Symbol(texto)
+        if tipo == 'constante':
+            return CONSTANTES_PERMITIDAS[texto]
+        if texto == '(':
+            self.entrar()
+            resultado = self.suma()
+            self.consumir(')')
+            self.profundidad -= 1
+            return resultado
+        if texto == '√':
+            self.entrar()
+            resultado = sqrt(self.atomo())
+            self.profundidad -= 1
+            return resultado
+        if tipo == 'funcion':
+            self.entrar()
+            if self.actual() == ('op', '('):
+                # Llamada con paréntesis: sin(x), log(x, 2)
+                self.consumir('(')
+                argumentos = [self.suma()]
+                while self.actual() == ('op', ','):
+                    self.consumir(',')
+                    argumentos.append(self.suma())
+                self.consumir(')')
+            else:
+                # Aplicación implícita: sin x, ln x^2
+                argumentos = [self.potencia()]
+            self.profundidad -= 1
+            try:
+                return FUNCIONES_PERMITIDAS[texto](*argumentos)
+            except TypeError:
+                raise ValueError(f"Número de argumentos incorrecto para '{texto}'.")
+        raise ValueError(f"Símbolo inesperado: '{texto}'")
+
+
+def interpretar_expresion(texto):
+    """
+    Convierte el texto del usuario en una expresión de Sympy usando el intérprete seguro.
+    """
+    return InterpreteExpresion(texto).interpretar()
+
+
+def verificar_tamano(expresion):
+    """
+    Comprueba que una expresión derivada (derivada o jacobiano) no haya crecido demasiado.
+    """
+    if sum(1 for _ in preorder_traversal(expresion)) > NODOS_DERIVADA_MAXIMOS:
+        raise ValueError("La derivada de la expresión es demasiado grande.")
+
+
+# Pasos simbólicos que se ejecutan en un proceso aparte (ver EjecutorSimbolico)
+
+def calcular_derivada(f_sym, x):
+    """
+    Calcula la derivada simbólica de f respecto a x y comprueba su tamaño.
+    """
+    fprime_sym = diff(f_sym, x)
+    verificar_tamano(fprime_sym)
+    return fprime_sym
+
+
+def calcular_jacobiano(F_sym, variables):
+    """
+    Calcula el jacobiano simbólico de un sistema y comprueba su tamaño.
+    """
+    J_sym = Matrix(F_sym).jacobian(variables)
+    verificar_tamano(J_sym)
+    return J_sym
+
+
+class EjecutorSimbolico:
+    """
+    Ejecuta los pasos simbólicos en un proceso aparte con tiempo límite, para que una
+    expresión patológica no congele la interfaz. El proceso se reinicia si se excede el tiempo.
+    """
+
+    def __init__(self):
+        self.contexto = multiprocessing.get_context("spawn")
+        self.pool = self.contexto.Pool(1)
+
+    def ejecutar(self, funcion, *argumentos):
+        tarea = self.pool.apply_async(funcion, argumentos)
+        try:
+            return tarea.get(TIEMPO_LIMITE)
+        except multiprocessing.TimeoutError:
+            self.pool.terminate()
+            self.pool = self.contexto.Pool(1)
+            raise TimeoutError(f"El cálculo simbólico superó {TIEMPO_LIMITE} segundos; simplifique la expresión.")
+
+
+# Verificación de raíces con aritmética de intervalos (Newton intervalar / Krawczyk)
+
+# Funciones de mpmath.iv que reemplazan a las de Sympy al evaluar sobre intervalos.
+# asin, acos y atan no están disponibles en mpmath.iv; las hiperbólicas se reescriben con exp.
+FUNCIONES_INTERVALO = {
+    'sin': iv.sin,
+    'cos': iv.cos,
+    'tan': iv.tan,
+    'exp': iv.exp,
+    'log': iv.log,
+    'sqrt': iv.sqrt,
+    'Abs': abs,
+    'pi': iv.pi,
+    'E': iv.e,
+    'e': iv.e,
+    # Sympy imprime los Float como mpf((signo, mantisa, exponente, bits))
+    'mpf': lambda valor: iv.mpf(mpmath.mpf(valor)),
+}
+
+
+def encerrar_raices(f_sym, fprime_sym, x, a, b, ancho_min=1e-12, max_intervalos=10000):
+    """
+    Busca raíces de f en [a, b] con el operador de Krawczyk y devuelve una lista de
+    intervalos (a_i, b_i), cada uno con garantía de contener exactamente una raíz.
+    Los intervalos que no se pueden decidir se bisecan en una cola de trabajo.
+    """
+    if f_sym.has(asin, acos, atan):
+        raise ValueError("La verificación por intervalos no admite asin, acos ni atan.")
+
+    # Convierte f y f' en funciones que operan sobre intervalos. Si la expresión es constante
+    # (por ejemplo f' de una función lineal), lambdify devuelve un número de Python: se convierte a intervalo
+    f_lambda = lambdify(x, f_sym.rewrite([sinh, cosh, tanh], exp), modules=[FUNCIONES_INTERVALO, 'mpmath'])
+    fprime_lambda = lambdify(x, fprime_sym.rewrite([sinh, cosh, tanh], exp), modules=[FUNCIONES_INTERVALO, 'mpmath'])
+
+    def f_iv(X):
+        return iv.mpf(f_lambda(X))
+
+    def fprime_iv(X):
+        return iv.mpf(fprime_lambda(X))
+
+    def krawczyk(X):
+        # Operador de Krawczyk: K(X) = m - y f(m) + (1 - y f'(X)) (X - m), con y ≈ 1/f'(m)
+        m = X.mid
+        fprime_m = fprime_iv(m)
+        if 0 in fprime_m:
+            raise ZeroDivisionError
+        y = iv.mpf(1 / float(fprime_m.mid))
+        return m - y * f_iv(m) + (1 - y * fprime_iv(X)) * (X - m)
+
+    encierros = []
+    cola = deque([iv.mpf([a, b])])
+    procesados = 0
+    while cola and procesados < max_intervalos:
+        X = cola.popleft()
+        procesados += 1
+        try:
+            # Si 0 no está en f(X), no hay raíz en X
+            if 0 not in f_iv(X):
+                continue
+            K = krawczyk(X)
+        except (ArithmeticError, ValueError, TypeError):
+            # Fuera del dominio o derivada nula en el punto medio: no se puede decidir, se biseca
+            K = None
+
+        if K is not None:
+            # K(X) en el interior de X: existe exactamente una raíz en X
+            if K.a > X.a and K.b < X.b:
+                # Se estrecha el encierro iterando X = K(X) mientras siga reduciéndose
+                while float(K.delta) > ancho_min and float(K.delta) < float(X.delta):
+                    X = K
+                    try:
+                        K = krawczyk(X)
+                    except (ArithmeticError, ValueError, TypeError):
+                        break
+                    K = iv.mpf([max(K.a, X.a), min(K.b, X.b)])
+                encierros.append((float(K.a), float(K.b)))
+                continue
+            # K(X) disjunto de X: no hay raíz en X
+            if K.b < X.a or K.a > X.b:
+                continue
+
+        # Caso indeterminado: se divide el intervalo en dos partes.
+        # El corte no es el punto medio exacto para no caer justo sobre raíces "redondas" (0, 1, ...)
+        if float(X.delta) > ancho_min:
+            c = X.a + iv.mpf(0.4990234375) * X.delta
+            cola.append(iv.mpf([X.a, c.a]))
+            cola.append(iv.mpf([c.a, X.b]))
+
+    encierros.sort()
+    return encierros
+
+
+def verificar_raiz(f_sym, fprime_sym, x, resultado, ultimo_paso):
+    """
+    Busca un encierro verificado de la raíz alrededor del resultado de Newton, con un radio
+    basado en el último paso. Devuelve (a, b) o None si no se puede verificar.
+    Solo cuenta un encierro que esté a menos de un paso del resultado, para no reportar
+    otra raíz cercana como si fuera la encontrada.
+    """
+    radio = max(2 * ultimo_paso, 1e-8 * max(1.0, abs(resultado)))
+    try:
+        # Una raíz simple se decide en pocas decenas de intervalos; el límite evita que una
+        # expresión costosa (composiciones anidadas) congele la interfaz durante la verificación
+        encierros = encerrar_raices(
+            f_sym, fprime_sym, x, resultado - radio, resultado + radio, max_intervalos=100
+        )
+    except Exception:
+        return None
+    encierros = [(a, b) for a, b in encierros if a - radio / 2 <= resultado <= b + radio / 2]
+    return encierros[0] if len(encierros) == 1 else None
+
+
+# Método de Newton-Raphson y selección automática del valor inicial
+
+def newton_raphson(f_num, fprime_num, x0, tol, max_iter=50):
+    """
+    Ejecuta las iteraciones de Newton-Raphson desde x0 y devuelve una lista de tuplas
+    (iteración, xi, f(xi), f'(xi), error relativo %). Lanza ValueError si falla.
+    """
+    iteraciones = []  # Lista para almacenar cada iteración
+    xi = x0  # Valor inicial
+    i = 0
+
+    try:
+        # Evaluación inicial: calculo de f(x0) y f'(x0)
+        fxi = f_num(xi)
+        fprime_xi = fprime_num(xi)
+        # Se guarda la primera iteración; el error se muestra como infinito en la primera fila
+        iteraciones.append((i, xi, fxi, fprime_xi, float('inf')))
+    except Exception as e:
+        raise ValueError(f"Error en la evaluación inicial: {e}")
+
+    # Inicio del ciclo iterativo
+    i = 1
+    while i <= max_iter:
+        try:
+            # Evaluación de la función y su derivada en el valor actual
+            fxi = f_num(xi)
+            fprime_xi = fprime_num(xi)
+        except Exception as e:
+            raise ValueError(f"Error en la iteración {i}: {e}")
+        # Verifica que la derivada no sea cero para evitar división por cero
+        if abs(fprime_xi) < 1e-10:
+            raise ValueError("La derivada es casi cero; no se puede continuar.")
+
+        try:
+            # Aplica la fórmula de Newton-Raphson para obtener la nueva aproximación
+            xi_new = xi - fxi / fprime_xi
+
+            # Cálculo del error relativo (en porcentaje) entre la nueva y la antigua aproximación
+            # (si la nueva aproximación es exactamente 0 se usa la diferencia absoluta)
+            raw_error = abs((xi_new - xi) / xi_new) * 100 if xi_new != 0 else abs(xi_new - xi) * 100
+            error_rel_porcentaje = round(raw_error, 4)
+
+            # Se evalúa la función y la derivada en la nueva aproximación
+            fxi_new = f_num(xi_new)
+            fprime_xi_new = fprime_num(xi_new)
+        except Exception as e:
+            raise ValueError(f"Error en la iteración {i}: {e}")
+
+        # Guarda la iteración actual y actualiza xi para la siguiente iteración
+        iteraciones.append((i, xi_new, fxi_new, fprime_xi_new, error_rel_porcentaje))
+        # Si el error es menor o igual que la tolerancia, se finaliza el ciclo
+        if error_rel_porcentaje <= tol:
+            break
+        xi = xi_new
+        i += 1
+    else:
+        # Se agotaron las iteraciones sin alcanzar la tolerancia (divergencia u oscilación)
+        raise ValueError(f"El método no converge en {max_iter} iteraciones.")
+
+    return iteraciones
+
+
+def elegir_x0(f_sym, fprime_sym, x, rangos=((-10, 10), (-100, 100)), muestras=2001, k=5, pasos=8):
+    """
+    Elige un valor inicial automáticamente. Evalúa f y f' con NumPy sobre una malla,
+    puntúa cada punto con |f| + |f/f'| (los cambios de signo de f también son candidatos),
+    lanza sondeos cortos de Newton desde los k mejores a la vez (vectorizados) y devuelve
+    el candidato que converge en menos pasos.
+    """
+    f_np = lambdify(x, f_sym, modules='numpy')
+    fprime_np = lambdify(x, fprime_sym, modules='numpy')
+
+    def evaluar(funcion, puntos):
+        # Las expresiones constantes devuelven un escalar; se expande al tamaño de la malla
+        return np.broadcast_to(np.asarray(funcion(puntos), dtype=float), puntos.shape)
+
+    with np.errstate(all='ignore'):
+        for a, b in rangos:
+            xs = np.linspace(a, b, muestras)
+            fx = evaluar(f_np, xs)
+            fpx = evaluar(fprime_np, xs)
+            validos = np.isfinite(fx) & np.isfinite(fpx) & (np.abs(fpx) >= 1e-10)
+
+            # Puntuación: |f| pequeño y paso de Newton |f/f'| corto
+            puntuacion = np.where(validos, np.abs(fx) + np.abs(fx / fpx), np.inf)
+            # Los puntos medios entre cambios de signo de f encierran una raíz: prioridad máxima
+            cambio = np.flatnonzero(np.isfinite(fx[:-1]) & np.isfinite(fx[1:]) & (np.sign(fx[:-1]) != np.sign(fx[1:])))
+            mejores = np.argsort(puntuacion)[:k]
+            mejores = mejores[np.isfinite(puntuacion[mejores])]
+            raices = (xs[cambio] + xs[cambio + 1]) / 2
+            raices = raices[np.argsort(np.abs(raices))]  # Primero los más cercanos al origen
+            candidatos = np.concatenate([raices, xs[mejores]])[:k]
+            if len(candidatos) == 0:
+                continue
+
+            # Sondeos de Newton en paralelo (un paso vectorizado para todos los candidatos)
+            xi = candidatos.copy()
+            pasos_necesarios = np.full(len(xi), np.inf)
+            for paso in range(1, pasos + 1):
+                fxi = evaluar(f_np, xi)
+                fpxi = evaluar(fprime_np, xi)
+                delta = fxi / fpxi
+                xi = xi - delta
+                convergido = np.isfinite(xi) & (np.abs(delta) <= 1e-10 * (1 + np.abs(xi)))
+                pasos_necesarios = np.where(convergido & np.isinf(pasos_necesarios), paso, pasos_necesarios)
+
+            # Se continúa solo con el candidato más rápido (con un paso de margen, el más cercano
+            # al origen); si ninguno convergió, el de menor |f| al final del sondeo
+            if np.isfinite(pasos_necesarios).any():
+                rapidos = pasos_necesarios <= pasos_necesarios.min() + 1
+                return float(candidatos[rapidos][np.argmin(np.abs(candidatos[rapidos]))])
+            residuo = np.abs(evaluar(f_np, xi))
+            residuo = np.where(np.isfinite(residuo), residuo, np.inf)
+            mejor = np.argmin(residuo)
+            if np.isfinite(residuo[mejor]):
+                return float(candidatos[mejor])
+
+    raise ValueError("No se encontró un valor inicial adecuado; ingrese x0 manualmente.")
+
+
+# Sistemas de ecuaciones no lineales: Newton multivariable (variantes cuerda / Shamanskii)
+
+def factorizar_lu(A):
+    """
+    Factorización LU con pivoteo parcial (PA = LU), guardada en una sola matriz.
+    Devuelve (LU, pivotes); lanza LinAlgError si la matriz es singular.
+    """
+    LU = np.array(A, dtype=float)
+    n = LU.shape[0]
+    pivotes = np.arange(n)
+    # La prueba de singularidad es relativa a la escala de la matriz (1e-15 * I es regular)
+    escala = np.max(np.abs(LU)) if LU.size else 0.0
+    if escala == 0:
+        raise np.linalg.LinAlgError("El jacobiano es singular.")
+    for k in range(n):
+        # Se elige como pivote el mayor elemento (en valor absoluto) de la columna
+        p = k + np.argmax(np.abs(LU[k:, k]))
+        if abs(LU[p, k]) <= 1e-14 * escala:
+            raise np.linalg.LinAlgError("El jacobiano es singular.")
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            pivotes[[k, p]] = pivotes[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    return LU, pivotes
+
+
+def resolver_lu(LU, pivotes, b):
+    """
+    Resuelve A x = b reutilizando la factorización de factorizar_lu (sustitución hacia
+    adelante y hacia atrás).
+    """
+    y = np.asarray(b, dtype=float)[pivotes]
+    n = len(y)
+    for i in range(1, n):
+        y[i] -= LU[i, :i] @ y[:i]
+    for i in range(n - 1, -1, -1):
+        y[i] = (y[i] - LU[i, i + 1:] @ y[i + 1:]) / LU[i, i]
+    return y
+
+
+def newton_sistema(F_sym, variables, x0, tol, max_iter=50, actualizar_cada=3, J_sym=None):
+    """
+    Resuelve el sistema F(x1..xn) = 0 con el método de Newton multivariable.
+    El jacobiano simbólico (J_sym, o se calcula si no se entrega) se convierte a NumPy una sola vez; su
+    factorización LU se reutiliza durante 'actualizar_cada' iteraciones (1 = Newton clásico,
+    valores mayores = variante de Shamanskii). Devuelve una lista de tuplas
+    (iteración, xi, ||F(xi)||, error relativo %). Lanza ValueError si no converge.
+    """
+    F_sym = Matrix(F_sym)
+    if J_sym is None:
+        J_sym = F_sym.jacobian(variables)  # Jacobiano simbólico (se calcula una sola vez)
+    F_num = lambdify(variables, F_sym, modules='numpy')
+    J_num = lambdify(variables, J_sym, modules='numpy')
+
+    def evaluar_F(xi):
+        return np.asarray(F_num(*xi), dtype=float).reshape(-1)
+
+    xi = np.asarray(x0, dtype=float)
+    Fxi = evaluar_F(xi)
+    iteraciones = [(0, xi.copy(), np.linalg.norm(Fxi), float('inf'))]
+
+    factorizacion = None
+    edad = 0  # Iteraciones desde la última actualización del jacobiano
+    # Solo cuentan los pasos aceptados; un paso rechazado obliga a actualizar el jacobiano,
+    # y el paso siguiente (Newton clásico) siempre se acepta
+    while len(iteraciones) <= max_iter:
+        if factorizacion is None or edad >= actualizar_cada:
+            J = np.asarray(J_num(*xi), dtype=float).reshape(len(xi), len(xi))
+            # Se factoriza una vez y se reutiliza para los siguientes pasos
+            factorizacion = factorizar_lu(J)
+            edad = 0
+        delta = resolver_lu(*factorizacion, Fxi)
+        xi_new = xi - delta
+        Fxi_new = evaluar_F(xi_new)
+        edad += 1
+
+        # Si el jacobiano reutilizado no reduce ||F||, se descarta el paso y se actualiza
+        if edad > 1 and not np.linalg.norm(Fxi_new) < np.linalg.norm(Fxi):
+            factorizacion = None
+            continue
+
+        # Error relativo (en porcentaje); si la nueva aproximación es exactamente 0 se usa la
+        # diferencia absoluta, igual que en newton_raphson
+        norma_xi = np.max(np.abs(xi_new))
+        if norma_xi != 0:
+            error_rel_porcentaje = np.max(np.abs(delta)) / norma_xi * 100
+        else:
+            error_rel_porcentaje = np.max(np.abs(delta)) * 100
+        iteraciones.append((len(iteraciones), xi_new.copy(), np.linalg.norm(Fxi_new), round(error_rel_porcentaje, 4)))
+        xi, Fxi = xi_new, Fxi_new
+        if error_rel_porcentaje <= tol:
+            return iteraciones
+
+    raise ValueError(f"El método no converge en {max_iter} iteraciones.")
+
+
+# Almacén persistente de sesiones (SQLite)
+
+# Archivo de sesión en la carpeta del usuario; guarda cada resolución entre ejecuciones
+RUTA_SESION = os.path.join(os.path.expanduser("~"), ".newton_raphson_sesion.sqlite3")
+
+
+def clave_resolucion(*partes):
+    """
+    Genera la clave (hash SHA-256) de una resolución a partir de la expresión ya
+    interpretada y de los parámetros, de modo que "x^2" y "x**2" compartan resultado.
+    """
+    return hashlib.sha256("|".join(repr(p) for p in partes).encode("utf-8")).hexdigest()
+
+
+class AlmacenSesion:
+    """
+    Guarda en SQLite las entradas, el historial de iteraciones, el resultado y el tiempo
+    de cada resolución, indexados por la clave de la expresión.
+    """
+
+    def __init__(self, ruta=RUTA_SESION):
+        try:
+            self.conexion = sqlite3.connect(ruta)
+            self._crear_tabla()
+        except sqlite3.Error:
+            # Si el archivo no se puede usar, la sesión solo dura mientras la aplicación esté abierta
+            self.conexion = sqlite3.connect(":memory:")
+            self._crear_tabla()
+
+    def _crear_tabla(self):
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS resoluciones ("
+            "  clave TEXT PRIMARY KEY,"
+            "  funcion TEXT, x0 TEXT, tolerancia TEXT,"
+            "  tipo TEXT, variables TEXT, iteraciones TEXT, resultado TEXT,"
+            "  duracion REAL, fecha REAL"
+            ")"
+        )
+        self.conexion.execute("CREATE INDEX IF NOT EXISTS idx_fecha ON resoluciones (fecha)")
+        # Valores iniciales que llevaron a una raíz, por expresión
+        self.conexion.execute("CREATE TABLE IF NOT EXISTS semillas (expresion TEXT PRIMARY KEY, x0 REAL)")
+        self.conexion.commit()
+
+    def _registro(self, fila):
+        if fila is None:
+            return None
+        funcion, x0, tolerancia, tipo, variables, iteraciones, resultado, duracion = fila
+        return {
+            'funcion': funcion,
+            'x0': x0,
+            'tolerancia': tolerancia,
+            'tipo': tipo,
+            'variables': json.loads(variables),
+            'iteraciones': json.loads(iteraciones),
+            'resultado': resultado,
+            'duracion': duracion,
+        }
+
+    def buscar(self, clave):
+        """
+        Devuelve la resolución guardada con esa clave (o None) y la marca como la más reciente.
+        """
+        fila = self.conexion.execute(
+            "SELECT funcion, x0, tolerancia, tipo, variables, iteraciones, resultado, duracion "
+            "FROM resoluciones WHERE clave = ?", (clave,)
+        ).fetchone()
+        if fila is not None:
+            self.conexion.execute("UPDATE resoluciones SET fecha = ? WHERE clave = ?", (time.time(), clave))
+            self.conexion.commit()
+        return self._registro(fila)
+
+    def guardar(self, clave, funcion, x0, tolerancia, tipo, variables, iteraciones, resultado, duracion):
+        """
+        Guarda (o reemplaza) una resolución. Los vectores de NumPy se guardan como listas.
+        """
+        filas = [[v.tolist() if isinstance(v, np.ndarray) else float(v) for v in fila] for fila in iteraciones]
+        self.conexion.execute(
+            "INSERT OR REPLACE INTO resoluciones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (clave, funcion, x0, tolerancia, tipo, json.dumps(variables), json.dumps(filas),
+             resultado, duracion, time.time())
+        )
+        self.conexion.commit()
+
+    def semilla(self, clave):
+        """
+        Devuelve el valor inicial guardado para una expresión (o None).
+        """
+        fila = self.conexion.execute("SELECT x0 FROM semillas WHERE expresion = ?", (clave,)).fetchone()
+        return fila[0] if fila is not None else None
+
+    def guardar_semilla(self, clave, x0):
+        """
+        Guarda un valor inicial cercano a la raíz para futuras resoluciones de la misma expresión.
+        """
+        if math.isfinite(x0):
+            self.conexion.execute("INSERT OR REPLACE INTO semillas VALUES (?, ?)", (clave, x0))
+            self.conexion.commit()
+
+    def ultima(self):
+        """
+        Devuelve la resolución más reciente, para restaurarla al abrir la aplicación.
+        """
+        fila = self.conexion.execute(
+            "SELECT funcion, x0, tolerancia, tipo, variables, iteraciones, resultado, duracion "
+            "FROM resoluciones ORDER BY fecha DESC LIMIT 1"
+        ).fetchone()
+        return self._registro(fila)
 
 
 # Clase CalculatorPage: Define la interfaz y funcionalidad
@@ -61,7 +786,10 @@ class CalculatorPage(QWidget):
         super().__init__()
         self.main_window = main_window  # Guarda referencia a la ventana principal
         self.current_input = None       # Controla cuál QLineEdit tiene el foco actualmente
+        self.sesion = AlmacenSesion()   # Almacén persistente de resoluciones anteriores
+        self.ejecutor = EjecutorSimbolico()  # Proceso aparte para derivadas y jacobianos
         self.initUI()                   # Inicializa la interfaz gráfica de la calculadora
+        self.restaurar_sesion()         # Recupera la última resolución guardada
 
     def initUI(self):
         """
@@ -406,39 +1134,23 @@ class CalculatorPage(QWidget):
         x0_str = x0_str.replace(',', '.')
         tol_str = tol_str.replace(',', '.')
 
-        # Verifica que ningún campo esté vacío
-        if not func_str or not x0_str or not tol_str:
-            QMessageBox.warning(self, "Error", "Por favor, complete todos los campos.")
+        # Varias ecuaciones separadas por ';' se resuelven como un sistema
+        if ';' in func_str:
+            if not x0_str or not tol_str:
+                QMessageBox.warning(self, "Error", "Por favor, complete todos los campos.")
+                return
+            self.calcular_sistema(func_str, x0_str, tol_str)
             return
 
-        # Transformaciones y diccionario para Sympy
-        transformations = standard_transformations + (implicit_multiplication_application, convert_xor)
-        local_dict = {
-        'x': symbols('x'),
-        'e': E,
-        'E': E,
-        'pi': pi,
-        'sin': sin,
-        'cos': cos,
-        'tan': tan,
-        'asin': asin,
-        'acos': acos,
-        'atan': atan,
-        'sinh': sinh,
-        'cosh': cosh,
-        'tanh': tanh,
-        'exp': exp,
-        'ln': log,
-        'log': log,
-        'sqrt': sqrt,
-        'Abs': Abs,
-        }
+        # Verifica que f(x) y la tolerancia no estén vacías (x0 vacío = valor inicial automático)
+        if not func_str or not tol_str:
+            QMessageBox.warning(self, "Error", "Por favor, complete todos los campos.")
+            return
 
         try:
-          # Parsear x0 y tol con Sympy para aceptar 'pi'
-         x0_expr = parse_expr(x0_str, transformations=transformations, local_dict=local_dict)
-         tol_expr = parse_expr(tol_str, transformations=transformations, local_dict=local_dict)
-         x0 = float(x0_expr.evalf())
+          # Interpretar x0 y tol con el intérprete seguro para aceptar 'pi'
+         x0 = float(interpretar_expresion(x0_str).evalf()) if x0_str else None
+         tol_expr = interpretar_expresion(tol_str)
          tol = float(tol_expr.evalf())
         except Exception as e:
          QMessageBox.warning(self, "Error", f"Error en x0 o tolerancia: {e}")
@@ -448,45 +1160,26 @@ class CalculatorPage(QWidget):
 
         # Se define la variable simbólica 'x'
         x = symbols('x')
-        # Se aplican transformaciones para permitir la multiplicación implícita y otras notaciones
-        transformations = (standard_transformations + (implicit_multiplication_application, convert_xor))
-
-        # Reemplaza símbolos especiales (por ejemplo, '√' se cambia por 'sqrt')
-        func_str = func_str.replace('√(', 'sqrt(')
-        func_str = func_str.replace('√x', 'sqrt(x)')
-
-       # Diccionario local para que el parser reconozca funciones y constantes comunes
-        local_dict = {
-        'x': symbols('x'),
-        'e': E,
-        'E': E,
-        'pi': pi,
-        'sin': sin,
-        'cos': cos,
-        'tan': tan,
-        'asin': asin,
-        'acos': acos,
-        'atan': atan,
-        'sinh': sinh,
-        'cosh': cosh,
-        'tanh': tanh,
-        'exp': exp,
-        'ln': log,
-        'log': log,
-        'sqrt': sqrt,
-        'Abs': Abs,
-        }
 
         try:
-            # Convierte la cadena en una expresión simbólica
-            f_sym = parse_expr(func_str, transformations=transformations, local_dict=local_dict)
+            # Convierte la cadena en una expresión simbólica (el intérprete reconoce '√')
+            f_sym = interpretar_expresion(func_str)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error al interpretar f(x): {e}")
             return
 
+        # Si esta expresión ya se resolvió con los mismos parámetros, se muestra el resultado guardado
+        clave = clave_resolucion('escalar', f_sym, x0, tol)
+        clave_semilla = clave_resolucion('semilla', f_sym)
+        registro = self.sesion.buscar(clave)
+        if registro is not None:
+            self.mostrar_registro(registro)
+            return
+        inicio = time.perf_counter()
+
         try:
-            # Calcula la derivada simbólica de la función
-            fprime_sym = diff(f_sym, x)
+            # Calcula la derivada simbólica de la función en un proceso aparte con tiempo límite
+            fprime_sym = self.ejecutor.ejecutar(calcular_derivada, f_sym, x)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error al calcular la derivada: {e}")
             return
@@ -499,68 +1192,59 @@ class CalculatorPage(QWidget):
             QMessageBox.warning(self, "Error", f"Error al convertir la función: {e}")
             return
 
-        # Inicialización de parámetros para las iteraciones
-        max_iter = 50  # Número máximo de iteraciones permitidas
-        iteraciones = []  # Lista para almacenar cada iteración
-        xi = x0  # Valor inicial
-        error_rel_porcentaje = float('inf')  # Inicializa el error relativo como infinito
-        i = 0
+        # Valores iniciales a probar en orden: el del usuario, la semilla guardada para esta
+        # expresión y, por último, uno elegido automáticamente (None)
+        candidatos = [x0] if x0 is not None else []
+        semilla = self.sesion.semilla(clave_semilla)
+        if semilla is not None and semilla != x0:
+            candidatos.append(semilla)
+        candidatos.append(None)
 
-        try:
-            # Evaluación inicial: calculo de f(x0) y f'(x0)
-            fxi = f_num(xi)
-            fprime_xi = fprime_num(xi)
-            # Se guarda la primera iteración; el error se muestra como infinito en la primera fila
-            iteraciones.append((i, xi, fxi, fprime_xi, float('inf')))
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error en la evaluación inicial: {e}")
-            return
-
-        # Inicio del ciclo iterativo
-        i = 1
-        while i <= max_iter:
+        errores = []
+        for candidato in candidatos:
             try:
-                # Evaluación de la función y su derivada en el valor actual
-                fxi = f_num(xi)
-                fprime_xi = fprime_num(xi)
-                # Verifica que la derivada no sea cero para evitar división por cero
-                if abs(fprime_xi) < 1e-10:
-                    QMessageBox.warning(self, "Error", "La derivada es casi cero; no se puede continuar.")
-                    return
-
-                # Aplica la fórmula de Newton-Raphson para obtener la nueva aproximación
-                xi_new = xi - fxi / fprime_xi
-
-                # Cálculo del error relativo (en porcentaje) entre la nueva y la antigua aproximación
-                
-                raw_error = abs((xi_new - xi) / xi_new) * 100
-
-                error_rel_porcentaje = round(raw_error, 4)
-
-            
-
-                # Se evalúa la función y la derivada en la nueva aproximación
-                fxi_new = f_num(xi_new)
-                fprime_xi_new = fprime_num(xi_new)
-                 # Guarda la iteración actual
-                
-                # Si el error es menor o igual que la tolerancia, se finaliza el ciclo
-                if error_rel_porcentaje == tol  :
-                   break
-                # Actualiza xi para la siguiente iteración
-                iteraciones.append((i, xi_new, fxi_new, fprime_xi_new, error_rel_porcentaje))
-                xi = xi_new
-                i += 1
+                x0_usado = elegir_x0(f_sym, fprime_sym, x) if candidato is None else candidato
+                iteraciones = newton_raphson(f_num, fprime_num, x0_usado, tol)
+                break
             except Exception as e:
-                QMessageBox.warning(self, "Error", f"Error en la iteración {i}: {e}")
-                return
+                errores.append(e)
+        else:
+            # Si el usuario dio x0 se informa primero por qué falló su valor inicial
+            if x0 is not None:
+                mensaje = f"Con x0 = {x0}: {errores[0]}\nCon x0 automático: {errores[-1]}"
+            else:
+                mensaje = str(errores[-1])
+            QMessageBox.warning(self, "Error", mensaje)
+            return
+        x0_automatico = x0_usado != x0
 
         # Se actualizan la tabla y la gráfica con los resultados obtenidos
         self.mostrar_resultados(iteraciones)
         self.graficar_resultados(iteraciones)
         # Se actualiza el label "Resultado:" con el último xi obtenido (formateado a 4 decimales)
         resultado_final = iteraciones[-1][1]
-        self.result_label.setText(f"Resultado de Xi= {resultado_final:.4f}")
+
+        # Verificación rigurosa: se busca un encierro de la raíz alrededor del resultado
+        ultimo_paso = abs(iteraciones[-1][1] - iteraciones[-2][1]) if len(iteraciones) > 1 else 0.0
+        encierro = verificar_raiz(f_sym, fprime_sym, x, resultado_final, ultimo_paso)
+        if encierro is not None:
+            a, b = encierro
+            self.result_label.setText(
+                f"Resultado de Xi= {resultado_final:.4f}  (raíz verificada en [{a:.10g}, {b:.10g}])"
+            )
+        else:
+            self.result_label.setText(f"Resultado de Xi= {resultado_final:.4f}  (raíz no verificada)")
+        if x0_automatico:
+            self.result_label.setText(self.result_label.text() + f"  — x0 automático = {x0_usado:.4f}")
+
+        # Se guarda la resolución en la sesión y, si la raíz quedó verificada,
+        # también como valor inicial para la próxima vez
+        if encierro is not None:
+            self.sesion.guardar_semilla(clave_semilla, resultado_final)
+        self.sesion.guardar(
+            clave, self.function_input.text().strip(), x0_str, tol_str, 'escalar', ['x'],
+            iteraciones, self.result_label.text(), time.perf_counter() - inicio
+        )
 
     def mostrar_resultados(self, iteraciones):
         """
@@ -568,6 +1252,9 @@ class CalculatorPage(QWidget):
         Cada fila de la tabla muestra: Iteración, xi, f(xi), f'(xi) y error relativo.
         """
         self.tabla.clearContents()
+        # Restablece las columnas por si antes se mostró un sistema de ecuaciones
+        self.tabla.setColumnCount(5)
+        self.tabla.setHorizontalHeaderLabels(["Iteración", "xi", "f(xi)", "f'(xi)", "Error"])
         self.tabla.setRowCount(len(iteraciones))
         for row, data in enumerate(iteraciones):
             for col, value in enumerate(data):
@@ -608,6 +1295,141 @@ class CalculatorPage(QWidget):
         ax.grid(True)            # Activa la cuadrícula
         self.canvas.draw()      
 
+    def calcular_sistema(self, func_str, x0_str, tol_str):
+        """
+        Resuelve un sistema de ecuaciones no lineales separadas por ';' (por ejemplo
+        "x^2 + y^2 - 4; x - y") con el método de Newton multivariable.
+        Los valores iniciales se ingresan en el mismo orden alfabético de las variables.
+        """
+        ecuaciones_str = [ec.strip() for ec in func_str.split(';') if ec.strip()]
+        x0_partes = [v.strip() for v in x0_str.split(';') if v.strip()]
+
+        try:
+            # Convierte cada ecuación en una expresión simbólica
+            F_sym = [interpretar_expresion(ec) for ec in ecuaciones_str]
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error al interpretar el sistema: {e}")
+            return
+
+        # Las variables del sistema se ordenan alfabéticamente
+        variables = sorted(set().union(*(f.free_symbols for f in F_sym)), key=lambda v: v.name)
+        if len(variables) != len(F_sym):
+            QMessageBox.warning(
+                self, "Error",
+                f"El sistema tiene {len(F_sym)} ecuaciones y {len(variables)} variables; deben coincidir."
+            )
+            return
+        if len(x0_partes) != len(variables):
+            nombres = "; ".join(v.name for v in variables)
+            QMessageBox.warning(self, "Error", f"Ingrese un valor inicial por variable, separados por ';' ({nombres}).")
+            return
+
+        try:
+            x0 = [float(interpretar_expresion(v).evalf()) for v in x0_partes]
+            tol = float(interpretar_expresion(tol_str).evalf())
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error en x0 o tolerancia: {e}")
+            return
+
+        # Si este sistema ya se resolvió con los mismos parámetros, se muestra el resultado guardado
+        clave = clave_resolucion('sistema', F_sym, x0, tol)
+        registro = self.sesion.buscar(clave)
+        if registro is not None:
+            self.mostrar_registro(registro)
+            return
+        inicio = time.perf_counter()
+
+        try:
+            # El jacobiano simbólico se calcula en un proceso aparte con tiempo límite
+            J_sym = self.ejecutor.ejecutar(calcular_jacobiano, F_sym, variables)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error al calcular el jacobiano: {e}")
+            return
+
+        try:
+            iteraciones = newton_sistema(F_sym, variables, x0, tol, J_sym=J_sym)
+        except np.linalg.LinAlgError:
+            QMessageBox.warning(self, "Error", "El jacobiano es singular; no se puede continuar.")
+            return
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error al resolver el sistema: {e}")
+            return
+
+        self.mostrar_resultados_sistema(iteraciones, variables)
+        self.graficar_resultados_sistema(iteraciones, variables)
+        resultado_final = ", ".join(f"{v.name}= {valor:.4f}" for v, valor in zip(variables, iteraciones[-1][1]))
+        self.result_label.setText(f"Resultado: {resultado_final}")
+
+        # Se guarda la resolución en la sesión
+        self.sesion.guardar(
+            clave, func_str, x0_str, tol_str, 'sistema', [v.name for v in variables],
+            iteraciones, self.result_label.text(), time.perf_counter() - inicio
+        )
+
+    def mostrar_registro(self, registro):
+        """
+        Muestra en la tabla, la gráfica y el label una resolución guardada en la sesión.
+        """
+        iteraciones = registro['iteraciones']
+        if registro['tipo'] == 'sistema':
+            variables = [symbols(nombre) for nombre in registro['variables']]
+            self.mostrar_resultados_sistema(iteraciones, variables)
+            self.graficar_resultados_sistema(iteraciones, variables)
+        else:
+            self.mostrar_resultados(iteraciones)
+            self.graficar_resultados(iteraciones)
+        self.result_label.setText(registro['resultado'])
+
+    def restaurar_sesion(self):
+        """
+        Al abrir la aplicación, recupera las entradas y los resultados de la última resolución.
+        """
+        registro = self.sesion.ultima()
+        if registro is None:
+            return
+        self.function_input.setText(registro['funcion'])
+        self.x0_input.setText(registro['x0'])
+        self.tolerance_input.setText(registro['tolerancia'])
+        self.mostrar_registro(registro)
+
+    def mostrar_resultados_sistema(self, iteraciones, variables):
+        """
+        Actualiza la tabla con el historial de un sistema: Iteración, una columna por
+        variable, la norma ||F(xi)|| y el error relativo.
+        """
+        self.tabla.clearContents()
+        self.tabla.setColumnCount(len(variables) + 3)
+        self.tabla.setHorizontalHeaderLabels(["Iteración"] + [v.name for v in variables] + ["||F(xi)||", "Error"])
+        self.tabla.setRowCount(len(iteraciones))
+        for row, (i, xi, norma_F, error) in enumerate(iteraciones):
+            # En la primera iteración el error se muestra como "---"
+            error_text = "---" if row == 0 else f"{error:.4f}"
+            textos = [str(int(i))] + [f"{valor:.4f}" for valor in xi] + [f"{norma_F:.4e}", error_text]
+            for col, text in enumerate(textos):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                item.setForeground(QColor(0, 0, 0))
+                self.tabla.setItem(row, col, item)
+        self.tabla.update()  # Refresca la visualización de la tabla
+        QApplication.processEvents()  # Asegura que la interfaz se actualice correctamente
+
+    def graficar_resultados_sistema(self, iteraciones, variables):
+        """
+        Grafica la evolución de cada variable del sistema a lo largo de las iteraciones.
+        """
+        numeros = [it[0] for it in iteraciones]
+
+        self.figure.clear()  # Limpia la figura actual
+        ax = self.figure.add_subplot(111)
+        for k, v in enumerate(variables):
+            ax.plot(numeros, [it[1][k] for it in iteraciones], marker='o', linestyle='-', label=f"${v.name}_i$")
+        ax.set_xlabel("Iteración")
+        ax.set_ylabel("Valor")
+        ax.set_title("Evolución de las variables del sistema")
+        ax.legend()
+        ax.grid(True)            # Activa la cuadrícula
+        self.canvas.draw()
+
     def mostrar_manual(self):
         """
         Cambia a la página del manual de uso.
@@ -658,8 +1480,15 @@ class ManualPage(QWidget):
         manual_text = (
             "<h3>Descripción de Campos y Funcionalidades</h3>"
             "<p><b>Campo f(x):</b> Ingrese la función matemática de la cual se desea encontrar la raíz. "
-            "Se aceptan expresiones simbólicas. "
-            "<p><b>Campo x0:</b> Valor inicial para iniciar el método. Es vital para la convergencia.</p>"
+            "Se aceptan expresiones simbólicas con las funciones sin, cos, tan, asin, acos, atan, sinh, cosh, tanh, "
+            "exp, ln, log, sqrt y abs, y las constantes e y pi. Por seguridad, la expresión se limita a "
+            "500 caracteres y 40 niveles de paréntesis, y la derivada debe calcularse en menos de 10 segundos.</p>"
+            "<p><b>Sistemas de ecuaciones:</b> Para resolver varias ecuaciones a la vez sepárelas con ';' "
+            "(por ejemplo: x^2 + y^2 - 4; x - y) e ingrese en x0 un valor inicial por variable, también separados "
+            "con ';' y en orden alfabético de las variables. La tabla muestra el valor de cada variable en cada iteración.</p>"
+            "<p><b>Campo x0:</b> Valor inicial para iniciar el método. Es vital para la convergencia. "
+            "Si se deja vacío, o si el método falla desde el valor ingresado, la calculadora elige un valor "
+            "inicial automáticamente y recuerda las raíces encontradas para las próximas resoluciones.</p>"
             "<p><b>Campo Tolerancia:</b> Porcentaje de error permitido para considerar la convergencia.</p>"
             "<h3>Uso de los Botones</h3>"
             "<p><b>Teclado Virtual:</b> Facilita la entrada de la función. Incluye botones para borrar (CE, C), "
@@ -667,7 +1496,12 @@ class ManualPage(QWidget):
             "<p><b>Botón Calcular:</b> Ejecuta el método Newton-Raphson y muestra los resultados en una tabla y en una gráfica.</p>"
             "<h3>Resultados y Gráficas</h3>"
             "<p><b>Tabla de Resultados:</b> Muestra cada iteración con xi, f(xi), f'(x_i) y el error relativo.</p>"
+            "<p><b>Raíz verificada:</b> El resultado se comprueba con aritmética de intervalos (método de Krawczyk). "
+            "Si se muestra un intervalo, está garantizado que contiene exactamente una raíz de f(x).</p>"
             "<p><b>Gráfica:</b> Visualiza la evolución de f(xi) y f'(x_i) a lo largo de las iteraciones.</p>"
+            "<p><b>Sesión:</b> Cada resolución se guarda automáticamente. Si vuelve a calcular la misma función "
+            "con el mismo x0 y la misma tolerancia, el resultado se muestra al instante, y al abrir la aplicación "
+            "se recupera la última resolución.</p>"
             "<h3>Navegación</h3>"
             "<p>Esta página cubre toda la pantalla. Para volver a la calculadora, presione el botón 'Regresar'.</p>"
         )
@@ -744,6 +1578,8 @@ class MainWindow(QMainWindow):
 # Inicio de la Aplicación
 # ========================================================
 if __name__ == "__main__":
+    # Necesario para el proceso de cálculo simbólico en ejecutables empaquetados (Windows)
+    multiprocessing.freeze_support()
     # Se crea la aplicación Qt
     app = QApplication(sys.argv)
     # Se instancia la ventana principal